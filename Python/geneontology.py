@@ -8,7 +8,11 @@ dans un graphe orienté basé sur la classe graph de gm.py.
 """
 
 import re
+import logging
 import gm
+from instrumentation import instr
+
+logger = logging.getLogger(__name__)
 
 def load_OBO(filename='go-basic.obo'):
     """
@@ -21,6 +25,7 @@ def load_OBO(filename='go-basic.obo'):
         # ignore les termes obsolètes
         for l in lines:
             if l.startswith('is_obsolete: true'):
+                instr.incr('geneontology.load_OBO.obsolete_terms')
                 return
         # création du nœud
         go_id = re_go_id.match(lines.pop(0)).group(1)
@@ -37,6 +42,7 @@ def load_OBO(filename='go-basic.obo'):
             elif re_go_alt_id.match(line):
                 alt = re_go_alt_id.match(line).group(1)
                 go_graph.alt_id[alt] = go_id
+                instr.incr('geneontology.load_OBO.alt_ids')
             elif re_go_is_a.match(line):
                 parent_id = re_go_is_a.match(line).group(1)
                 go_graph.add_edge(go_id, parent_id, {'relationship': 'is_a'})
@@ -58,7 +64,8 @@ def load_OBO(filename='go-basic.obo'):
     re_go_part_of = re.compile(r'^relationship:\s+part_of\s+(GO:\d+)\s')
 
     # lecture du fichier
-    with open(filename) as f:
+    n_lines = 0
+    with instr.timer('geneontology.load_OBO'), open(filename) as f:
         line = f.readline().rstrip()
         # saute le header
         while not line.startswith('[Term]'):
@@ -69,6 +76,7 @@ def load_OBO(filename='go-basic.obo'):
             if not line:
                 parseTerm(buff)
                 break
+            n_lines += 1
             line = line.rstrip()
             if line.startswith('[Term]'):
                 parseTerm(buff)
@@ -78,6 +86,7 @@ def load_OBO(filename='go-basic.obo'):
                 break
             else:
                 buff.append(line)
+    instr.incr('geneontology.load_OBO.lines_parsed', n_lines)
     return go_graph
 
 
@@ -85,9 +94,15 @@ def load_GOA(go, filename, warnings=True):
     """
     Parse un fichier GOA et ajoute les produits géniques annotés
     au graphe GO précédemment chargé.
+
+    Les termes non rattachables sont signalés via le logger du module
+    (niveau WARNING) si warnings vaut True.
     """
-    with open(filename) as f:
+    # compteurs locaux, reportés dans instr à la fin du chargement
+    n_lines, n_alt, n_unresolved = 0, 0, 0
+    with instr.timer('geneontology.load_GOA'), open(filename) as f:
         for line in f:
+            n_lines += 1
             if line.startswith('!'):  # ignorer les commentaires
                 continue
             cols = line.rstrip().split('\t')
@@ -98,11 +113,13 @@ def load_GOA(go, filename, warnings=True):
             if gt_id not in go.nodes:
                 while gt_id not in go.nodes and gt_id in go.alt_id:
                     gt_id = go.alt_id[gt_id]
+                    n_alt += 1
 
             # terme non trouvé
             if gt_id not in go.nodes:
+                n_unresolved += 1
                 if warnings:
-                    print(f"⚠️ Impossible de rattacher {gp_id} à {gt_id}")
+                    logger.warning("Impossible de rattacher %s à %s", gp_id, gt_id)
                 continue
 
             # création du produit génique
@@ -119,6 +136,9 @@ def load_GOA(go, filename, warnings=True):
             if 'evidence-codes' not in e_attr:
                 e_attr['evidence-codes'] = []
             e_attr['evidence-codes'].append(cols[6])
+    instr.incr('geneontology.load_GOA.lines_parsed', n_lines)
+    instr.incr('geneontology.load_GOA.alt_id_resolutions', n_alt)
+    instr.incr('geneontology.load_GOA.unresolved_terms', n_unresolved)
 
 
 def GOTerms(go, gp_id, recursive=False):
@@ -11,9 +11,13 @@ dirigés ou non dirigés, pondérés ou non, et intégrable dans des workflows
 bioinformatiques ou analytiques légers.
 """
 
+import logging
 import polars as pl
 import pandas as pd
 from pprint import pprint
+from instrumentation import instr
+
+logger = logging.getLogger(__name__)
 
 class graph :
     def __init__(self, directed=True, weighted=False, weight_attribute=None):
@@ -253,14 +257,15 @@ class graph :
         dict
             Graphe construit à partir du fichier.
         """
-        df = pl.read_csv(
-            filename,
-            separator=column_separator,
-            has_header=True,
-            infer_schema_length=1000,
-            quote_char=None,
-            truncate_ragged_lines=True
-        )
+        with instr.timer('gm.read_delim.parse'):
+            df = pl.read_csv(
+                filename,
+                separator=column_separator,
+                has_header=True,
+                infer_schema_length=1000,
+                quote_char=None,
+                truncate_ragged_lines=True
+            )
 
         cols = df.columns
         if len(cols) < 2:
@@ -270,13 +275,15 @@ class graph :
         att_cols = cols[2:]
 
         g = cls(directed=directed, weighted=weighted, weight_attribute=weight_attribute)
-        pdf = df.to_pandas()
+        with instr.timer('gm.read_delim.build'):
+            pdf = df.to_pandas()
 
-        for _, row in pdf.iterrows():
-            u = row[src_col]
-            v = row[tgt_col]
-            att = {col: row[col] for col in att_cols}
-            g.add_edge(u, v, att)
+            for _, row in pdf.iterrows():
+                u = row[src_col]
+                v = row[tgt_col]
+                att = {col: row[col] for col in att_cols}
+                g.add_edge(u, v, att)
+        instr.incr('gm.read_delim.lines_parsed', len(pdf))
 
         return g
 
@@ -289,20 +296,37 @@ class graph :
         non_visites est un booléen qui indique si on veut inclure les sommets non traités dans le résultat final
 
         La fonction retourne un dictionnaire contenant pour chaque sommet son état (blanc, gris, noir), sa distance par rapport au sommet de départ, et son parent dans le parcours.
+
+        Si l'instrumentation est activée (voir instrumentation.py), le parcours est chronométré, les sommets défilés et arêtes examinées sont comptés, et un évènement 'bfs.dequeue' est émis pour chaque sommet défilé.
         """
+        if instr.enabled: # chemin instrumenté, le chemin par défaut reste sans surcoût
+            with instr.timer('gm.bfs'):
+                return self._BFS(s, cible, instr)
+        return self._BFS(s, cible, None)
+
+    def _BFS(self, s, cible, mesures):
     # création variable des états des sommets : couleurs pour chaque sommet non visité (blanc), en cours de visite (gris), visité (noir), distances pour la distance entre le sommet de départ et chaque sommet, parents pour le parent de chaque sommet dans le parcours
         etat, distances, parents = {}, {}, {}
 
         etat[s] = 'gris' # initialisation du sommet de départ, etat gris, c'est à dire en cours de visite , distance 0, pas de parent
         distances[s] = 0
         attente = [s] # création de la file d'attente pour le parcours
+        n_defiles, n_aretes = 0, 0 # compteurs locaux, reportés à la fin si mesures est fourni
+        crochets = mesures is not None and bool(mesures.hooks)
 
         while len(attente) != 0: # tant que la file n'est pas vide, la boucle continue
             u = attente.pop(0) # extraction du premier sommet de la file, pour signifier qu'on le visite
+            if mesures is not None:
+                n_defiles += 1
+                if crochets:
+                    mesures.emit('bfs.dequeue', {'source': s, 'node': u, 'distance': distances[u]})
 
             if u == cible:
                 break
 
+            if mesures is not None:
+                n_aretes += len(self.edges[u])
+
             for voisin in self.edges[u]:# pour chaque voisin du sommet u
                 if voisin not in etat: # si le voisin n'a pas encore été visité
                     etat[voisin] = 'gris' # on le marque comme en cours de visite (etat gris)
@@ -310,6 +334,9 @@ class graph :
                     parents[voisin] = u # on met à jour le parent du voisin comme étant u
                     attente.append(voisin) # et on les rajoutes dans la file d'attente
             etat[u] = 'noir' #sommet visité, on le marque en noir
+        if mesures is not None:
+            mesures.incr('gm.bfs.nodes_dequeued', n_defiles)
+            mesures.incr('gm.bfs.edges_scanned', n_aretes)
         if cible and cible in parents or cible == s: # soit on a une cible (autre que None) et la cible a des parents (cas générale) soit notre cible est notre point de départ dans ce cas il n'a pas de parents
             chemin = [cible] # on rajoute la cible a notre chemin
             while chemin[-1] != s : # donc temps que le dernier de la liste n'est pas notre point de départ on continu
@@ -333,21 +360,25 @@ class graph :
         dict
         """
         if not self.directed:
-            n_CC = 0
-            CC = {}
-            for u in self.nodes:
-                CC[u] = None
-
-            for u in self.nodes:
-                if CC[u] == None:
-                    parcours = self.BFS(u)
-                    CC[u] = n_CC
-                    for v in parcours['Distance'].keys():
-                        CC[v]= n_CC
-                    n_CC += 1
+            with instr.timer('gm.connected_components'):
+                n_CC = 0
+                CC = {}
+                for u in self.nodes:
+                    CC[u] = None
+
+                for u in self.nodes:
+                    if CC[u] == None:
+                        parcours = self.BFS(u)
+                        CC[u] = n_CC
+                        for v in parcours['Distance'].keys():
+                            CC[v]= n_CC
+                        if instr.enabled:
+                            instr.emit('cc.component', {'component': n_CC, 'root': u, 'size': len(parcours['Distance'])})
+                        n_CC += 1
+            instr.incr('gm.connected_components.components', n_CC)
             return CC
         else :
-            print("votre graphe doit être non orienté !")
+            logger.warning("votre graphe doit être non orienté !")
 
     def sousgraphe_induit(self, nodes):
         sg = graph(
@@ -0,0 +1,253 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Instrumentation optionnelle pour gm.py et geneontology.py
+=========================================================
+Ce module fournit une couche de mesure désactivée par défaut :
+chronomètres par phase, compteurs, et crochets (callbacks) appelés
+à chaque étape des parcours. Lorsqu'elle est désactivée, chaque point
+de mesure se réduit à un simple test de booléen.
+
+Exemple
+-------
+    import gm
+    import instrumentation as ins
+
+    g = gm.graph(directed=False)
+    g.add_edge('A', 'B')
+    g.add_edge('B', 'C')
+
+    ins.enable()
+    ins.add_hook(lambda event, data: print(event, data))
+    g.BFS('A')
+    ins.snapshot()
+    # {'counters': {'gm.bfs.nodes_dequeued': 3, 'gm.bfs.edges_scanned': 4},
+    #  'timers': {'gm.bfs': {'seconds': ..., 'count': 1}}}
+    print(ins.to_prometheus())
+"""
+
+import re
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _NullTimer:
+    """Chronomètre sans effet, renvoyé quand l'instrumentation est désactivée."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Chronomètre qui cumule la durée d'une phase dans un Instrumentation."""
+
+    __slots__ = ('instr', 'name', 'start')
+
+    def __init__(self, instr, name):
+        self.instr = instr
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        total, count = self.instr.timers.get(self.name, (0.0, 0))
+        self.instr.timers[self.name] = (total + elapsed, count + 1)
+        return False
+
+
+class Instrumentation:
+    def __init__(self):
+        """
+        Initialise un collecteur de métriques vide et désactivé.
+
+        Attributes
+        ----------
+        enabled : bool
+            Active ou non la collecte (False par défaut).
+        counters : dict
+            Nom du compteur → valeur entière.
+        timers : dict
+            Nom de la phase → tuple (durée cumulée en secondes, nombre d'appels).
+        hooks : list
+            Fonctions appelées sous la forme hook(event, data) par emit().
+        """
+        self.enabled = False
+        self.counters = {}
+        self.timers = {}
+        self.hooks = []
+
+    def incr(self, name, n=1):
+        """
+        Incrémente un compteur (sans effet si l'instrumentation est désactivée).
+
+        Parameters
+        ----------
+        name : str
+            Nom du compteur, ex. 'gm.bfs.nodes_dequeued'.
+        n : int, optional
+            Valeur à ajouter (1 par défaut).
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def timer(self, name):
+        """
+        Renvoie un gestionnaire de contexte mesurant la durée d'une phase.
+
+        Parameters
+        ----------
+        name : str
+            Nom de la phase, ex. 'geneontology.load_GOA'.
+
+        Returns
+        -------
+        context manager
+            Chronomètre actif, ou chronomètre nul si désactivé.
+        """
+        if self.enabled:
+            return _Timer(self, name)
+        return _NULL_TIMER
+
+    def add_hook(self, hook):
+        """
+        Enregistre une fonction appelée à chaque évènement émis.
+
+        Parameters
+        ----------
+        hook : callable
+            Fonction de signature hook(event, data) où event est une chaîne
+            (ex. 'bfs.dequeue') et data un dictionnaire.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """
+        Retire une fonction précédemment enregistrée par add_hook().
+        """
+        self.hooks.remove(hook)
+
+    def emit(self, event, data):
+        """
+        Transmet un évènement à tous les crochets enregistrés.
+
+        Les exceptions levées par un crochet sont journalisées sans
+        interrompre le parcours en cours.
+        """
+        if not (self.enabled and self.hooks):
+            return
+        for hook in self.hooks:
+            try:
+                hook(event, data)
+            except Exception:
+                logger.exception("Erreur dans le crochet %r pour l'évènement %s", hook, event)
+
+    def reset(self):
+        """
+        Remet à zéro les compteurs et chronomètres (les crochets sont conservés).
+        """
+        self.counters = {}
+        self.timers = {}
+
+    def snapshot(self):
+        """
+        Exporte les métriques collectées.
+
+        Returns
+        -------
+        dict
+            {'counters': {nom: valeur},
+             'timers': {nom: {'seconds': float, 'count': int}}}
+        """
+        return {
+            'counters': dict(self.counters),
+            'timers': {name: {'seconds': total, 'count': count}
+                       for name, (total, count) in self.timers.items()},
+        }
+
+    def to_prometheus(self, prefix='projet_graph'):
+        """
+        Exporte les métriques au format texte de Prometheus.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Préfixe ajouté au nom de chaque métrique.
+
+        Returns
+        -------
+        str
+            Les compteurs sont exportés en 'counter' suffixé par '_total' ;
+            chaque chronomètre est exporté en une famille 'summary' '<nom>_seconds'
+            avec les échantillons '_seconds_sum' et '_seconds_count'.
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = _metric_name(prefix, name) + '_total'
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, (total, count) in sorted(self.timers.items()):
+            metric = _metric_name(prefix, name) + '_seconds'
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"{metric}_sum {total!r}")
+            lines.append(f"{metric}_count {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_re_metric = re.compile(r'[^a-zA-Z0-9_]')
+
+
+def _metric_name(prefix, name):
+    return _re_metric.sub('_', f"{prefix}_{name}" if prefix else name)
+
+
+# instance partagée par gm.py et geneontology.py
+instr = Instrumentation()
+
+
+def enable():
+    """Active la collecte des métriques et l'appel des crochets."""
+    instr.enabled = True
+
+
+def disable():
+    """Désactive la collecte ; les points de mesure redeviennent sans coût."""
+    instr.enabled = False
+
+
+def reset():
+    """Remet à zéro les métriques de l'instance partagée."""
+    instr.reset()
+
+
+def add_hook(hook):
+    """Enregistre un crochet hook(event, data) sur l'instance partagée."""
+    instr.add_hook(hook)
+
+
+def remove_hook(hook):
+    """Retire un crochet de l'instance partagée."""
+    instr.remove_hook(hook)
+
+
+def snapshot():
+    """Renvoie les métriques de l'instance partagée sous forme de dictionnaire."""
+    return instr.snapshot()
+
+
+def to_prometheus(prefix='projet_graph'):
+    """Renvoie les métriques de l'instance partagée au format Prometheus."""
+    return instr.to_prometheus(prefix)
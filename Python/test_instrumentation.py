@@ -0,0 +1,103 @@
+#!/bin/env python
+
+import gm
+import geneontology as gom
+import instrumentation as ins
+from pprint import pprint
+
+def petit_graphe():
+  g = gm.graph(directed=False)
+  g.add_edge('A', 'B')
+  g.add_edge('A', 'C')
+  g.add_edge('B', 'D')
+  g.add_edge('E', 'F')
+  return g
+
+print('test : résultats identiques avec et sans instrumentation')
+g = petit_graphe()
+ins.disable()
+bfs_off, cc_off, chemin_off = g.BFS('A'), g.connected_components(), g.BFS('A', 'D')
+assert ins.snapshot() == {'counters': {}, 'timers': {}}  # rien n'est collecté si désactivé
+
+ins.enable()
+ins.reset()
+evenements = []
+def crochet(event, data):
+  evenements.append((event, data))
+ins.add_hook(crochet)
+assert g.BFS('A') == bfs_off
+assert g.BFS('A', 'D') == chemin_off
+assert g.connected_components() == cc_off
+pprint(ins.snapshot())
+
+print('test : compteurs BFS / connected_components')
+c = ins.snapshot()['counters']
+# BFS('A') : 4 défilés, 6 arêtes ; BFS('A', 'D') : 4 défilés, 5 arêtes (D n'est pas parcouru)
+# connected_components : BFS('A') puis BFS('E') : 4 + 2 défilés, 6 + 2 arêtes
+assert c['gm.bfs.nodes_dequeued'] == 4 + 4 + 6
+assert c['gm.bfs.edges_scanned'] == 6 + 5 + 8
+assert c['gm.connected_components.components'] == 2
+t = ins.snapshot()['timers']
+assert t['gm.bfs']['count'] == 4
+assert t['gm.connected_components']['count'] == 1
+
+print('test : évènements')
+assert [e for e, _ in evenements].count('bfs.dequeue') == 14
+assert [d for e, d in evenements if e == 'cc.component'] == [
+  {'component': 0, 'root': 'A', 'size': 4},
+  {'component': 1, 'root': 'E', 'size': 2},
+]
+assert evenements[0] == ('bfs.dequeue', {'source': 'A', 'node': 'A', 'distance': 0})
+
+print('test : une exception dans un crochet n\'interrompt pas le parcours')
+def crochet_fautif(event, data):
+  raise RuntimeError('crochet fautif')
+ins.add_hook(crochet_fautif)
+n = len(evenements)
+assert g.BFS('A') == bfs_off
+assert len(evenements) == n + 4  # l'autre crochet est toujours appelé
+ins.remove_hook(crochet_fautif)
+
+print('test : reset conserve les crochets')
+ins.reset()
+assert ins.snapshot() == {'counters': {}, 'timers': {}}
+n = len(evenements)
+g.BFS('E')
+assert len(evenements) == n + 2
+ins.remove_hook(crochet)
+
+print('test : chargement OBO / GOA')
+ins.reset()
+vir = gom.load_OBO('Python/data/go-virion_component.obo')
+gom.load_GOA(vir, 'Python/data/uniprot_sars-cov-2.gaf', warnings=False)
+snap = ins.snapshot()
+pprint(snap)
+c = snap['counters']
+assert c['geneontology.load_OBO.lines_parsed'] == 416
+assert c['geneontology.load_GOA.alt_id_resolutions'] == 8
+assert c['geneontology.load_GOA.unresolved_terms'] == 150
+assert c['geneontology.load_GOA.lines_parsed'] == 167
+assert snap['timers']['geneontology.load_OBO']['count'] == 1
+assert snap['timers']['geneontology.load_GOA']['count'] == 1
+
+print('test : format Prometheus')
+ins.reset()
+g.BFS('A')
+prom = ins.to_prometheus()
+print(prom)
+lignes = prom.splitlines()
+assert lignes[:6] == [
+  '# TYPE projet_graph_gm_bfs_edges_scanned_total counter',
+  'projet_graph_gm_bfs_edges_scanned_total 6',
+  '# TYPE projet_graph_gm_bfs_nodes_dequeued_total counter',
+  'projet_graph_gm_bfs_nodes_dequeued_total 4',
+  '# TYPE projet_graph_gm_bfs_seconds summary',
+  'projet_graph_gm_bfs_seconds_sum ' + repr(ins.snapshot()['timers']['gm.bfs']['seconds']),
+]
+assert lignes[6] == 'projet_graph_gm_bfs_seconds_count 1'
+assert len(lignes) == 7
+
+ins.disable()
+ins.reset()
+assert ins.to_prometheus() == ''
+print('OK')